@@ -1,78 +1,209 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.integrate import quad
+import sympy as sp
+from scipy.integrate import quad, quad_vec
+
+# numba is optional: with it, the point-load accumulation runs as a parallel
+# compiled kernel
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Bending moment integrand (x - xi) * q(xi) of a distributed load about x
+def moment_integrand(xi, x, func):
+    return (x - xi) * func(xi)
+
+# Shear and moment integrands of a distributed load for every grid point at
+# once, after substituting xi = a + u * h (h is the integration length per point)
+def grid_integrand(u, a, h, x_vals, func):
+    xi = a + u * h
+    q = func(xi) * h
+    return np.stack([q, (x_vals - xi) * q])
+
+# Shear force and bending moment from point loads (and reactions) at every x
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def point_load_contributions(x_vals, xf, F):
+        shear = np.zeros(x_vals.shape[0])
+        moment = np.zeros(x_vals.shape[0])
+        for i in prange(x_vals.shape[0]):
+            x = x_vals[i]
+            for j in range(xf.shape[0]):
+                if xf[j] <= x:
+                    shear[i] += F[j]
+                    moment[i] += F[j] * (x - xf[j])
+        return shear, moment
+else:
+    def point_load_contributions(x_vals, xf, F):
+        # Sort the loads by position once, then every x picks up the running
+        # sums of F and F * xf up to it
+        order = np.argsort(xf)
+        xf, F = xf[order], F[order]
+        cumF = np.concatenate([[0], np.cumsum(F)])
+        cumFx = np.concatenate([[0], np.cumsum(F * xf)])
+        idx = np.searchsorted(xf, x_vals, side='right')
+        return cumF[idx], x_vals * cumF[idx] - cumFx[idx]
 
 # Class to represent a distributed load on a beam
 class DistributedLoad:
     def __init__(self, func_str, start, end):
         # Initialize with a function string, start, and end positions
         self.func_str = func_str
-        # Convert the function string to a lambda function
-        self.func = lambda x: eval(func_str)
+        # Parse the function string once into a NumPy-aware callable that
+        # accepts scalars as well as arrays
+        x = sp.Symbol('x')
+        expr = sp.sympify(func_str)
+        self.func = sp.lambdify(x, expr, 'numpy')
         self.start = start
         self.end = end
-        # Calculate the total force using numerical integration
-        self.total_force, _ = quad(self.func, start, end)
-        # Calculate the centroid of the distributed load
-        self.centroid = quad(lambda x: x * self.func(x), start, end)[0] / self.total_force
-
-# Function to plot the beam with loads and supports
-def plot_beam(ax, L, point_loads, dist_loads, supports, show_reactions=False):
-    ax.clear()
-    # Draw the beam
-    ax.plot([0, L], [0, 0], 'k-', linewidth=4, zorder=1)
-    # Draw the supports at specified positions
-    for x in supports:
-        ax.plot(x, 0, '^', markersize=15, color='k', zorder=2)
-    # Draw point forces with arrows and annotations
-    for x, F in point_loads:
-        color = 'blue' if F > 0 else 'red'
-        direction = 1 if F > 0 else -1
+        # Polynomial loads get exact antiderivatives of q(x) and x * q(x);
+        # both stay None for any other function
+        self.antiderivative = self.moment_antiderivative = None
+        try:
+            poly = sp.Poly(expr, x)
+        except sp.PolynomialError:
+            poly = None
+        if poly is not None:
+            self.antiderivative = sp.lambdify(x, poly.integrate().as_expr(), 'numpy')
+            self.moment_antiderivative = sp.lambdify(x, (poly * x).integrate().as_expr(), 'numpy')
+            self.total_force, self.first_moment = self.exact_integrals(start, end)
+        else:
+            # Calculate the total force and its first moment in one adaptive
+            # pass, integrating q(x) and x * q(x) together
+            def integrand(xi):
+                q = self.func(xi)
+                return np.array([q, xi * q])
+
+            (self.total_force, self.first_moment), _ = quad_vec(integrand, start, end)
+        # Position of the resultant force, kept for reporting (the reactions use
+        # first_moment directly); a load with no net force relative to its moment
+        # (e.g. sin(x) over a full period) has none, so use the midpoint
+        if abs(self.total_force) <= 1e-12 * abs(self.first_moment):
+            self.centroid = 0.5 * (start + end)
+        else:
+            self.centroid = self.first_moment / self.total_force
+
+    # Integrals of q(x) and x * q(x) over [a, b] from the polynomial
+    # antiderivatives; b may be an array of upper limits
+    def exact_integrals(self, a, b):
+        S = self.antiderivative(b) - self.antiderivative(a)
+        Sx = self.moment_antiderivative(b) - self.moment_antiderivative(a)
+        return S, Sx
+
+# Class to plot the beam with loads and supports; it keeps its artists and
+# updates them in place on every redraw instead of clearing the axes
+class BeamPlot:
+    def __init__(self, ax):
+        self.ax = ax
+        self.beam_line, = ax.plot([], [], 'k-', linewidth=4, zorder=1)
+        self.support_markers, = ax.plot([], [], '^', markersize=15, color='k', zorder=2)
+        # One quiver for all point-load arrows, a (label,) per point load and
+        # (fill, curve, label) per distributed load
+        self.load_arrows = None
+        self.point_artists = []
+        self.dist_artists = []
+        ax.set_xlabel("Position (m)")
+        ax.get_yaxis().set_visible(False)
+        ax.grid(True, linestyle='--', alpha=0.7)
+
+    # Grow or shrink a list of artist groups to n entries, creating new ones with make()
+    @staticmethod
+    def resize(groups, n, make):
+        while len(groups) > n:
+            for artist in groups.pop():
+                artist.remove()
+        while len(groups) < n:
+            groups.append(make())
+
+    def plot(self, L, pl_x, pl_F, dist_loads, supports, show_reactions=False):
+        ax = self.ax
+        # Draw the beam
+        self.beam_line.set_data([0, L], [0, 0])
+        # Draw the supports at specified positions
+        self.support_markers.set_data(supports, np.zeros(len(supports)))
+        # Draw point forces with arrows and annotations
         arrow_length = L / 10
-        ax.arrow(x, 0, 0, direction * arrow_length,
-                 head_width=L / 30, head_length=arrow_length / 2,
-                 fc=color, ec=color, zorder=3)
-        ax.text(x + L / 50, direction * (arrow_length + L / 15),
-                f'{abs(F):.1f} N', color=color,
-                ha='left' if F > 0 else 'right', va='center')
-    # Draw distributed loads with actual function shape
-    for dl in dist_loads:
-        x = np.linspace(dl.start, dl.end, 100)
-        y = [dl.func(xi) for xi in x]
-        ax.fill_between(x, y, alpha=0.3, color='green')
-        ax.plot(x, y, 'g-', linewidth=2)
-        # Annotation with function and total force
-        max_y = max(y) if len(y) > 0 else 0
-        ax.text((dl.start + dl.end) / 2, max_y + L / 20,
-                f'q(x) = {dl.func_str}\nTotal: {dl.total_force:.1f} N',
-                ha='center', color='darkgreen', fontsize=8)
-    ax.set_xlim(-L / 5, L + L / 5)
-    ax.set_ylim(-L / 2, L / 2)
-    ax.set_title("Beam Loading Diagram" + (" (With Reactions)" if show_reactions else ""))
-    ax.set_xlabel("Position (m)")
-    ax.get_yaxis().set_visible(False)
-    ax.grid(True, linestyle='--', alpha=0.7)
+        zeros = np.zeros(len(pl_x))
+        # Quiver arrows include their head, which adds half an arrow length
+        dy = np.where(pl_F > 0, 1, -1) * (arrow_length + arrow_length / 2)
+        colors = np.where(pl_F > 0, 'blue', 'red')
+        # A quiver holds a fixed number of arrows, so rebuild it when that changes
+        if self.load_arrows is not None and self.load_arrows.N != len(pl_x):
+            self.load_arrows.remove()
+            self.load_arrows = None
+        if self.load_arrows is None:
+            self.load_arrows = ax.quiver(pl_x, zeros, zeros, dy, color=colors,
+                                         angles='xy', scale_units='xy', scale=1,
+                                         width=0.003, headwidth=8, headlength=6.5,
+                                         headaxislength=6.5, zorder=3)
+        else:
+            self.load_arrows.set_offsets(np.column_stack([pl_x, zeros]))
+            self.load_arrows.set_UVC(zeros, dy)
+            self.load_arrows.set_color(colors)
+        self.resize(self.point_artists, len(pl_x), lambda: (ax.text(0, 0, '', va='center'),))
+        for (label,), x, F in zip(self.point_artists, pl_x, pl_F):
+            color = 'blue' if F > 0 else 'red'
+            direction = 1 if F > 0 else -1
+            label.set_position((x + L / 50, direction * (arrow_length + L / 15)))
+            label.set_text(f'{abs(F):.1f} N')
+            label.set_color(color)
+            label.set_horizontalalignment('left' if F > 0 else 'right')
+        # Draw distributed loads with actual function shape
+        self.resize(self.dist_artists, len(dist_loads),
+                    lambda: (ax.fill([], [], alpha=0.3, color='green')[0],
+                             ax.plot([], [], 'g-', linewidth=2)[0],
+                             ax.text(0, 0, '', ha='center', color='darkgreen', fontsize=8)))
+        for (fill, curve, label), dl in zip(self.dist_artists, dist_loads):
+            x = np.linspace(dl.start, dl.end, 100)
+            y = dl.func(x)
+            if np.isscalar(y):
+                y = np.full_like(x, y)  # constant loads evaluate to a scalar
+            fill.set_xy(np.column_stack([np.concatenate([x, x[::-1]]),
+                                         np.concatenate([y, np.zeros_like(y)])]))
+            curve.set_data(x, y)
+            # Annotation with function and total force
+            max_y = y.max() if y.size else 0
+            label.set_position(((dl.start + dl.end) / 2, max_y + L / 20))
+            label.set_text(f'q(x) = {dl.func_str}\nTotal: {dl.total_force:.1f} N')
+        ax.set_xlim(-L / 5, L + L / 5)
+        ax.set_ylim(-L / 2, L / 2)
+        ax.set_title("Beam Loading Diagram" + (" (With Reactions)" if show_reactions else ""))
 
 # Function to calculate shear force and bending moment diagrams
-def calculate_diagrams(L, point_loads, dist_loads, reactions):
-    x_vals = np.linspace(0, L, 1000)
-    shear = np.zeros_like(x_vals)
-    moment = np.zeros_like(x_vals)
-    all_loads = point_loads + reactions
-    for i, x in enumerate(x_vals):
-        # Point loads contribution to shear and moment
-        shear[i] = sum(F for xf, F in all_loads if xf <= x)
-        moment[i] = sum(F * (x - xf) for xf, F in all_loads if xf <= x)
-        # Distributed loads contribution to shear and moment
-        for dl in dist_loads:
-            if x >= dl.start:
-                a = max(dl.start, 0)
-                b = min(dl.end, x)
-                if b > a:
-                    shear[i] += quad(dl.func, a, b)[0]
-                    moment[i] += quad(lambda xi: (x - xi) * dl.func(xi), a, b)[0]
+def calculate_diagrams(L, pl_x, pl_F, reaction_x, reaction_F, dist_loads):
+    xf = np.concatenate([pl_x, reaction_x])
+    F = np.concatenate([pl_F, reaction_F])
+    # Sample the beam on a coarse uniform grid plus every point where the
+    # diagrams have a kink or jump: each point load, the position just before
+    # it (so shear jumps are drawn vertically) and the distributed load ends
+    dl_ends = np.array([[dl.start, dl.end] for dl in dist_loads], dtype=float).ravel()
+    x_vals = np.unique(np.concatenate([np.linspace(0, L, 200), xf,
+                                       np.nextafter(xf, -np.inf), dl_ends]))
+    x_vals = x_vals[(x_vals >= 0) & (x_vals <= L)]
+    # Point loads contribution to shear and moment
+    shear, moment = point_load_contributions(x_vals, xf, F)
+    # Distributed loads contribution
+    for dl in dist_loads:
+        a = max(dl.start, 0)
+        h = np.maximum(np.minimum(x_vals, dl.end) - a, 0)
+        if dl.antiderivative is not None:
+            S, Sx = dl.exact_integrals(a, a + h)
+            shear += S
+            moment += x_vals * S - Sx
+            continue
+        # Substituting xi = a + u * (b - a) maps every grid point's integral
+        # onto u in [0, 1], so a single adaptive quad_vec pass integrates all
+        # of them at once
+        dl_shear, dl_moment = quad_vec(grid_integrand, 0, 1, args=(a, h, x_vals, dl.func))[0]
+        shear += dl_shear
+        moment += dl_moment
     return x_vals, shear, moment
 
+# Indices of the minimum and maximum of a diagram, usable for fancy indexing
+def extremes(a):
+    return [a.argmin(), a.argmax()]
+
 # Function to plot shear force and bending moment diagrams
 def plot_diagrams(x_vals, shear, moment):
     fig, axes = plt.subplots(2, 1, figsize=(10, 8))
@@ -81,12 +212,10 @@ def plot_diagrams(x_vals, shear, moment):
     ax1.plot(x_vals, shear, 'r-', linewidth=2)
     ax1.fill_between(x_vals, shear, color='red', alpha=0.3)
     # Find and annotate shear extremes
-    shear_min_idx = np.argmin(shear)
-    shear_max_idx = np.argmax(shear)
-    for idx, prefix in [(shear_min_idx, 'Min'), (shear_max_idx, 'Max')]:
-        ax1.plot(x_vals[idx], shear[idx], 'ko')
-        ax1.annotate(f'{prefix}: {shear[idx]:.1f} N\n@ {x_vals[idx]:.1f} m',
-                     (x_vals[idx], shear[idx]),
+    idx = extremes(shear)
+    for x, s, prefix in zip(x_vals[idx], shear[idx], ['Min', 'Max']):
+        ax1.plot(x, s, 'ko')
+        ax1.annotate(f'{prefix}: {s:.1f} N\n@ {x:.1f} m', (x, s),
                      textcoords="offset points", xytext=(0, 10 if prefix == 'Min' else -15),
                      ha='center', va='center')
     ax1.set_title("Shear Force Diagram")
@@ -97,12 +226,10 @@ def plot_diagrams(x_vals, shear, moment):
     ax2.plot(x_vals, moment, 'b-', linewidth=2)
     ax2.fill_between(x_vals, moment, color='blue', alpha=0.3)
     # Find and annotate moment extremes
-    moment_min_idx = np.argmin(moment)
-    moment_max_idx = np.argmax(moment)
-    for idx, prefix in [(moment_min_idx, 'Min'), (moment_max_idx, 'Max')]:
-        ax2.plot(x_vals[idx], moment[idx], 'ko')
-        ax2.annotate(f'{prefix}: {moment[idx]:.1f} Nm\n@ {x_vals[idx]:.1f} m',
-                     (x_vals[idx], moment[idx]),
+    idx = extremes(moment)
+    for x, m, prefix in zip(x_vals[idx], moment[idx], ['Min', 'Max']):
+        ax2.plot(x, m, 'ko')
+        ax2.annotate(f'{prefix}: {m:.1f} Nm\n@ {x:.1f} m', (x, m),
                      textcoords="offset points", xytext=(0, 10 if prefix == 'Min' else -15),
                      ha='center', va='center')
     ax2.set_title("Bending Moment Diagram")
@@ -113,29 +240,59 @@ def plot_diagrams(x_vals, shear, moment):
     plt.tight_layout()
 
 # Function to calculate internal forces at a specific position
-def calculate_internal_forces(x, L, point_loads, dist_loads, reactions):
-    shear = sum(F for xf, F in point_loads + reactions if xf <= x)
-    moment = sum(F * (x - xf) for xf, F in point_loads + reactions if xf <= x)
+def calculate_internal_forces(x, L, pl_x, pl_F, reaction_x, reaction_F, dist_loads):
+    xf = np.concatenate([pl_x, reaction_x])
+    F = np.concatenate([pl_F, reaction_F])
+    shear, moment = point_load_contributions(np.array([x]), xf, F)
+    shear, moment = shear[0], moment[0]
     for dl in dist_loads:
         if x >= dl.start:
             a = max(dl.start, 0)
             b = min(dl.end, x)
-            if b > a:
+            if b > a and dl.antiderivative is not None:
+                S, Sx = dl.exact_integrals(a, b)
+                shear += S
+                moment += x * S - Sx
+            elif b > a:
                 shear += quad(dl.func, a, b)[0]
-                moment += quad(lambda xi: (x - xi) * dl.func(xi), a, b)[0]
+                moment += quad(moment_integrand, a, b, args=(x, dl.func))[0]
     return shear, moment
 
+# Function to calculate the support reactions from force and moment equilibrium;
+# also returns whether they are statically determinate (exactly two supports)
+def calculate_reactions(supports, pl_x, pl_F, dist_loads):
+    sum_F = pl_F.sum() + sum(dl.total_force for dl in dist_loads)
+    sum_M = (pl_F * pl_x).sum() + sum(dl.first_moment for dl in dist_loads)
+    # One row per equilibrium equation (forces, moments about x = 0), one
+    # column per support
+    reaction_x = np.array(supports, dtype=float)
+    A = np.vstack([np.ones_like(reaction_x), reaction_x])
+    b = np.array([-sum_F, -sum_M])
+    if reaction_x.size == 2:
+        if np.linalg.matrix_rank(A) < 2:
+            raise ValueError("Two supports at the same position cannot resist a moment; "
+                             "place them at different positions.")
+        return reaction_x, np.linalg.solve(A, b), True
+    # Statically indeterminate beams get the minimum-norm least-squares
+    # solution, which is not the physical one
+    reaction_F = np.linalg.lstsq(A, b, rcond=None)[0]
+    # Fewer than two (distinct) supports cannot balance the loads at all
+    if not np.allclose(A @ reaction_F, b, atol=1e-9 * max(1.0, np.abs(b).max())):
+        raise ValueError(f"{reaction_x.size} support(s) cannot hold the beam in equilibrium; "
+                         "at least two supports at different positions are needed.")
+    return reaction_x, reaction_F, False
+
 # Main function to orchestrate the input, calculations, and plotting
 def main():
     # Input parameters
     L = float(input("Enter beam length (m): "))
-    # Point loads input
-    point_loads = []
+    # Point loads input, stored as separate position and force arrays
     n_points = int(input("Enter number of point loads: "))
+    pl_x = np.zeros(n_points)
+    pl_F = np.zeros(n_points)
     for i in range(n_points):
-        x = float(input(f"\nPoint load {i + 1} position (0-{L}): "))
-        F = float(input(f"Point load {i + 1} value (N, +↑/-↓): "))
-        point_loads.append((x, F))
+        pl_x[i] = float(input(f"\nPoint load {i + 1} position (0-{L}): "))
+        pl_F[i] = float(input(f"Point load {i + 1} value (N, +↑/-↓): "))
     # Distributed loads input
     dist_loads = []
     n_dist = int(input("\nEnter number of distributed loads: "))
@@ -151,23 +308,30 @@ def main():
         x = float(input(f"Support point {i + 1} position (0-{L}): "))
         supports.append(x)
     # Calculate reactions
-    sum_F = sum(F for _, F in point_loads) + sum(dl.total_force for dl in dist_loads)
-    sum_M = sum(F * x for x, F in point_loads) + sum(dl.total_force * dl.centroid for dl in dist_loads)
-    R2 = -sum_M / L
-    R1 = -sum_F - R2
-    reactions = [(0, R1), (L, R2)]
-    print(f"\nReactions: R₁ = {R1:.2f} N, R₂ = {R2:.2f} N")
+    try:
+        reaction_x, reaction_F, determinate = calculate_reactions(supports, pl_x, pl_F, dist_loads)
+    except ValueError as e:
+        print(f"\nError: {e}")
+        return
+    if not determinate:
+        print(f"\nNote: equilibrium alone only determines the reactions of two supports. "
+              f"For the {reaction_x.size} supports given, these are the minimum-norm "
+              "least-squares reactions, which ignore beam stiffness and are not the physical values.")
+    subscripts = str.maketrans('0123456789', '₀₁₂₃₄₅₆₇₈₉')
+    print("\nReactions: " + ", ".join(f"R{str(i + 1).translate(subscripts)} = {R:.2f} N"
+                                     for i, R in enumerate(reaction_F)))
     # Plot beam with all loads
     fig, ax = plt.subplots(figsize=(10, 4))
-    plot_beam(ax, L, point_loads + reactions, dist_loads, supports, show_reactions=True)
+    BeamPlot(ax).plot(L, np.concatenate([pl_x, reaction_x]), np.concatenate([pl_F, reaction_F]),
+                      dist_loads, supports, show_reactions=True)
     # Calculate and plot diagrams
-    x_vals, shear, moment = calculate_diagrams(L, point_loads, dist_loads, reactions)
+    x_vals, shear, moment = calculate_diagrams(L, pl_x, pl_F, reaction_x, reaction_F, dist_loads)
     plot_diagrams(x_vals, shear, moment)
     # Ask user if they want to calculate internal forces at a specific position
     calc_internal = input("\nDo you want to calculate internal forces at a specific position? (yes/no): ").strip().lower()
     if calc_internal == 'yes':
         x = float(input(f"Enter the position (0-{L}) to calculate internal forces: "))
-        shear, moment = calculate_internal_forces(x, L, point_loads, dist_loads, reactions)
+        shear, moment = calculate_internal_forces(x, L, pl_x, pl_F, reaction_x, reaction_F, dist_loads)
         print(f"\nInternal forces at x = {x:.2f} m:\nShear Force = {shear:.2f} N\nBending Moment = {moment:.2f} Nm")
     plt.show()  # Show all figures at once here
 